@@ -16,16 +16,23 @@ Required files in current directory:
 
 Output:
     YHapLZ.py
+    tree_warnings.log (rows dropped or merged while building the tree)
 """
 
 import sys
 import os
 import re
+import importlib.util
+from collections import Counter
 
-def parse_isogg_tree(file_path):
+def parse_isogg_tree(file_path, warnings=None):
     """
     Parse ISOGG format tree file
     Returns: [(indent_level, haplogroup, main_SNP), ...]
+    
+    warnings: optional list; dropped rows that look like data problems
+              (bracketed notes, spaces inside the indentation) are appended
+              as "file:line: reason" strings
     """
     nodes = []
     
@@ -33,37 +40,45 @@ def parse_isogg_tree(file_path):
         print(f"  Warning: {file_path} does not exist, skipping")
         return nodes
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            if not line.strip():
-                continue
-            
-            # Count tab indentation
-            tabs = 0
-            for ch in line:
-                if ch == '\t':
-                    tabs += 1
+    # One bulk read as bytes; only the two short fields of kept rows are
+    # decoded, instead of the whole file being decoded, re-split and
+    # re-stripped per line
+    with open(file_path, 'rb') as f:
+        lines = f.read().split(b'\n')
+    
+    for line_no, line in enumerate(lines, 1):
+        # Count tab indentation (lstrip scans the run in C)
+        content = line.lstrip(b'\t')
+        tabs = len(line) - len(content)
+        parts = content.split(b'\t', 1)
+        haplo = parts[0].strip()
+        
+        # Skip blank rows, uncertain nodes and bracketed notes (e.g.
+        # withdrawn SNP remarks), which would otherwise adopt the following
+        # subtree
+        if b'~' in haplo or b'*' in haplo or not haplo or haplo.startswith(b'['):
+            # Uncertain (~, *) nodes are dropped by design; report the rest
+            row = content.strip()
+            row_haplo = row.split(b'\t', 1)[0]
+            if (warnings is not None and row
+                    and b'~' not in row_haplo and b'*' not in row_haplo):
+                if haplo:
+                    reason = f"bracketed note dropped: {row.decode('utf-8')[:40]}"
                 else:
-                    break
-            
-            content = line[tabs:].rstrip('\n\r')
-            parts = content.split('\t', 1)
-            haplo = parts[0].strip()
-            
-            # Skip uncertain nodes
-            if '~' in haplo or '*' in haplo or not haplo:
-                continue
-            
-            # Extract main SNP
-            if len(parts) > 1 and parts[1].strip():
-                snp_str = parts[1].strip()
-                first_snp = snp_str.split(',')[0].strip()
-                first_snp = first_snp.split('/')[0].strip()
-                first_snp = first_snp.replace('^^', '').replace('^', '').replace('~', '').strip()
-            else:
-                first_snp = haplo
-            
-            nodes.append((tabs, haplo, first_snp))
+                    reason = f"space in indentation, row dropped: {row_haplo.decode('utf-8')}"
+                warnings.append(f"{file_path}:{line_no}: {reason}")
+            continue
+        haplo = haplo.decode('utf-8')
+        
+        # Extract main SNP
+        snp_str = parts[1].strip() if len(parts) > 1 else b''
+        if snp_str:
+            first_snp = snp_str.split(b',', 1)[0].split(b'/', 1)[0]
+            first_snp = first_snp.decode('utf-8').replace('^^', '').replace('^', '').replace('~', '').strip()
+        else:
+            first_snp = haplo
+        
+        nodes.append((tabs, haplo, first_snp))
     
     return nodes
 
@@ -77,6 +92,42 @@ def format_branch(nodes, base_indent):
         lines.append(f"{indent}{haplo}\t{snp}")
     return '\n'.join(lines)
 
+def pack_tree(module_file):
+    """
+    Parse OFFICIAL_TREE of a generated YHapLZ.py once
+    Returns: (PhyloTree, PhyloTree.pack() text)
+    """
+    spec = importlib.util.spec_from_file_location('_yhaplz_build', module_file)
+    module = importlib.util.module_from_spec(spec)
+    dont_write_bytecode, sys.dont_write_bytecode = sys.dont_write_bytecode, True
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.dont_write_bytecode = dont_write_bytecode
+    
+    tree = module.PhyloTree(module.OFFICIAL_TREE)
+    
+    # Node ids must be a preorder numbering (parent before child, each
+    # subtree one contiguous id range): subtree and ancestor queries in
+    # PhyloTree rely on it instead of walking the tree
+    sizes = tree.subtree_sizes()
+    for node, parent in enumerate(tree.parent):
+        if parent >= 0 and not parent < node < parent + sizes[parent]:
+            print(f"\nError: tree node {tree.names[node]} is not in preorder")
+            sys.exit(1)
+    
+    return tree, tree.pack(module.OFFICIAL_TREE)
+
+def tree_stats(tree):
+    """
+    Shape statistics of a parsed tree
+    Returns: (max_depth, max_fanout, {child_count: node_count}, duplicate names)
+    """
+    child_counts = Counter(parent for parent in tree.parent if parent >= 0)
+    fanouts = Counter(child_counts[node] for node in range(len(tree)))
+    duplicates = sorted(name for name, count in Counter(tree.names).items() if count > 1)
+    return max(tree.depth), max(fanouts), dict(sorted(fanouts.items())), duplicates
+
 def generate_yhaplz():
     """Generate YHapLZ.py"""
     
@@ -113,8 +164,9 @@ def generate_yhaplz():
     # Parse all tree files
     print("\nParsing tree files...")
     parsed_trees = {}
+    warnings = []
     for hg, (filename, _) in haplogroups.items():
-        nodes = parse_isogg_tree(filename)
+        nodes = parse_isogg_tree(filename, warnings)
         if nodes:
             parsed_trees[hg] = nodes
             print(f"  {hg}: {len(nodes)} nodes")
@@ -355,8 +407,32 @@ def generate_yhaplz():
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write(new_code)
     
+    # Embed pre-parsed tree so YHapLZ.py does not parse the text at startup;
+    # the text itself stays in the tree files and is not shipped
+    tree, packed = pack_tree(output_file)
+    packed_lines = [packed[i:i + 76] for i in range(0, len(packed), 76)]
+    new_code = re.sub(pattern, lambda m: 'OFFICIAL_TREE = None  # Built from ATREE.txt ... TTREE.txt',
+                      new_code, flags=re.DOTALL)
+    new_code = new_code.replace('# Using indented text format for easy maintenance and review',
+                                '# Pre-parsed from the indented tree files by generate_YHapLZ.py')
+    new_code = new_code.replace(
+        'OFFICIAL_TREE_DATA = None',
+        'OFFICIAL_TREE_DATA = """\n' + '\n'.join(packed_lines) + '\n"""', 1)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(new_code)
+    
     # Statistics
     total_nodes = sum(len(nodes) for nodes in parsed_trees.values())
+    max_depth, max_fanout, fanouts, duplicates = tree_stats(tree)
+    for name in duplicates:
+        warnings.append(f"{name}: name occurs more than once, lookups use the last row")
+    
+    warnings_file = 'tree_warnings.log'
+    if warnings:
+        with open(warnings_file, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(warnings) + '\n')
+    elif os.path.exists(warnings_file):
+        os.remove(warnings_file)
     
     print(f"\n{'='*60}")
     print(f"Generation complete!♡(*´∀｀*)人(*´∀｀*)♡")
@@ -364,6 +440,12 @@ def generate_yhaplz():
     print(f"  Output: {output_file}")
     print(f"  Total haplogroup branches: {len(parsed_trees)}")
     print(f"  Total tree nodes: {total_nodes}")
+    print(f"  Pre-parsed tree nodes: {len(tree)}")
+    print(f"  Max depth: {max_depth}, max children per node: {max_fanout}")
+    print(f"  Children per node: " +
+          ", ".join(f"{k}:{v}" for k, v in fanouts.items()))
+    if warnings:
+        print(f"  Warnings: {len(warnings)} (see {warnings_file})")
     print(f"\nUsage:")
     print(f"  python YHapLZ.py -v <input.vcf> -i <indexdata.csv> -o <output_dir>")
     print(f"\nExample:")
@@ -22,9 +22,26 @@ Classification logic (simulates manual classification):
 import os
 import sys
 import argparse
-import gzip
+import base64
+import hashlib
+import io
+import marshal
+import mmap
+import multiprocessing
+import pickle
+import zlib
+from array import array
 from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
+from operator import itemgetter
+
+try:
+    from isal import igzip as gzip  # ISA-L accelerated inflate, optional
+except ImportError:
+    import gzip
 
 VERSION = "4.0"
 
@@ -172,6 +189,11 @@ Y	Root
 																	R2	M479
 """
 
+# Pre-parsed OFFICIAL_TREE (see PhyloTree.pack), filled in by
+# generate_YHapLZ.py, which then drops the text; None means the text is
+# parsed at startup
+OFFICIAL_TREE_DATA = None
+
 
 class GenotypeStatus:
     """Genotype status enumeration"""
@@ -182,6 +204,457 @@ class GenotypeStatus:
     MISMATCH = "mismatch"    # Mismatch
 
 
+class GenotypeMatrix:
+    """
+    Site-major genotype storage packed at 2 bits per call
+    
+    Calls use PLINK .bed codes (0 = hom REF, 1 = missing, 2 = het,
+    3 = hom ALT), four samples per byte with the first sample in the
+    lowest bits. Calls that are not biallelic REF/ALT calls (e.g. '1/2')
+    are packed as missing and keep their VCF GT in a per-site table, so
+    they still read back, and classify, as the original call.
+    """
+    
+    # VCF GT -> 2-bit code
+    GT_CODES = {
+        '0/0': 0, '0|0': 0, '0': 0,
+        '0/1': 2, '0|1': 2, '1/0': 2, '1|0': 2,
+        '1/1': 3, '1|1': 3, '1': 3
+    }
+    MISSING_CODE = 1
+    HET_CODE = 2
+    
+    # 2-bit code -> canonical VCF GT
+    GT_CALLS = ('0/0', './.', '0/1', '1/1')
+    
+    # Packed byte with hom REF/hom ALT swapped in every lane
+    # (PLINK .bed counts the .bim A1 allele, which VCF export writes as ALT)
+    BED_FLIP = bytes(b ^ sum(3 << s for s in (0, 2, 4, 6) if (b >> s) & 3 in (0, 3))
+                     for b in range(256))
+    
+    # Packed byte -> 2-bit code of the sample in each of its four lanes
+    LANE_CODES = [bytes((b >> shift) & 3 for b in range(256)) for shift in (0, 2, 4, 6)]
+    
+    __slots__ = ('samples', 'sample_index', 'row_bytes', 'site_index', 'rows', 'calls',
+                 'raw_gts')
+    
+    def __init__(self, samples):
+        self.samples = list(samples)
+        self.sample_index = {sample: i for i, sample in enumerate(self.samples)}
+        self.row_bytes = (len(self.samples) + 3) // 4
+        self.site_index = {}  # pos -> site id
+        self.rows = []        # site id -> packed calls
+        self.calls = []       # site id -> (gt, ref, alt) per 2-bit code
+        self.raw_gts = []     # site id -> {sample index: GT} of unpacked calls, or None
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def __getitem__(self, sample):
+        return SampleGenotypes(self, self.sample_index[sample])
+    
+    def pack(self, codes):
+        """Pack one 2-bit code per sample (bytes) into a .bed style row"""
+        # Codes are <= 3, so each byte lane can be shifted into place
+        # across the whole row at once without carrying into its neighbour
+        packed = 0
+        for lane in range(4):
+            packed |= int.from_bytes(codes[lane::4], 'little') << (2 * lane)
+        return packed.to_bytes(self.row_bytes, 'little')
+    
+    def column(self, sample, rows=None):
+        """
+        One sample's 2-bit codes across sites, one byte per site
+        
+        rows: packed rows to read (default: all sites, in load order)
+        """
+        index = self.sample_index[sample]
+        if rows is None:
+            rows = self.rows
+        column = bytes(map(itemgetter(index >> 2), rows))
+        return column.translate(self.LANE_CODES[index & 3])
+    
+    def add_site(self, pos, ref, alt, codes, raw_gts=None):
+        """
+        Add a site from one 2-bit code per sample, replacing any earlier one
+        
+        raw_gts: {sample index: GT} of calls packed as missing that are not
+                 missing calls (e.g. '1/2'), or None
+        """
+        if len(codes) < len(self.samples):
+            codes += bytes([self.MISSING_CODE]) * (len(self.samples) - len(codes))
+        
+        self.add_row(pos, ref, alt, self.pack(codes), raw_gts)
+    
+    def add_row(self, pos, ref, alt, row, raw_gts=None):
+        """Add a site from an already packed row, replacing any earlier one"""
+        calls = tuple((gt, ref, alt) for gt in self.GT_CALLS)
+        
+        site = self.site_index.get(pos)
+        if site is None:
+            self.site_index[pos] = len(self.rows)
+            self.rows.append(row)
+            self.calls.append(calls)
+            self.raw_gts.append(raw_gts)
+        else:
+            self.rows[site] = row
+            self.calls[site] = calls
+            self.raw_gts[site] = raw_gts
+
+
+class SampleGenotypes(Mapping):
+    """Read-only {pos: (gt, ref, alt)} view of one sample of a GenotypeMatrix"""
+    
+    __slots__ = ('matrix', 'index', 'byte', 'shift')
+    
+    def __init__(self, matrix, index):
+        self.matrix = matrix
+        self.index = index
+        self.byte = index >> 2
+        self.shift = (index & 3) << 1
+    
+    def __getitem__(self, pos):
+        matrix = self.matrix
+        site = matrix.site_index[pos]
+        call = matrix.calls[site][(matrix.rows[site][self.byte] >> self.shift) & 3]
+        raw_gts = matrix.raw_gts[site]
+        if raw_gts and self.index in raw_gts:
+            return (raw_gts[self.index],) + call[1:]
+        return call
+    
+    def __contains__(self, pos):
+        return pos in self.matrix.site_index
+    
+    def __iter__(self):
+        return iter(self.matrix.site_index)
+    
+    def __len__(self):
+        return len(self.matrix.site_index)
+
+
+class PhyloTree:
+    """
+    Phylogenetic tree in flat preorder form
+    
+    Each tree line becomes one node, numbered 0..N-1 in file order, so a
+    parent always precedes its children. Node fields are parallel arrays:
+        names[i]        haplogroup name
+        parent[i]       parent node id (-1 for top level)
+        depth[i]        number of ancestors
+    
+    Defining SNP names are interned once into snp_names (indexed by
+    snp_name_to_id, built on first use for packed trees); node i carries
+    snp_ids[snp_start[i]:snp_start[i + 1]].
+    
+    Name lookups resolve to the last occurrence of a name (name_to_id);
+    resolved_parent[i] is the node the name of i's parent resolves to and
+    ancestor_count[i] the length of that name-based ancestor walk, so the
+    walks step through int arrays.
+    """
+    
+    __slots__ = ('names', 'parent', 'depth', 'name_to_id', 'snp_names', '_snp_name_to_id', 'snp_start',
+                 'snp_ids', 'resolved_parent', 'ancestor_count', '_subtree_sizes')
+    
+    # Header of packed trees (format version 4)
+    PACK_MAGIC = b'YHT4'
+    
+    # Node-indexed arrays, stored as int16 while node ids fit
+    NODE_ARRAYS = ('parent', 'depth', 'resolved_parent', 'ancestor_count')
+    
+    def __init__(self, tree_text, packed=None):
+        """
+        tree_text: indented tree text, or None if only packed is available
+        packed:    output of pack(); used instead of parsing when tree_text
+                   is None or matches its digest
+        """
+        self.names = []
+        self.parent = array('i')
+        self.depth = array('i')
+        self.name_to_id = {}
+        self.snp_names = []
+        self._snp_name_to_id = {}
+        self.snp_start = array('i', [0])
+        self.snp_ids = array('i')
+        self.resolved_parent = array('i')
+        self.ancestor_count = array('i')
+        self._subtree_sizes = None
+        if not (packed and self._unpack(packed, tree_text)):
+            self._parse(tree_text)
+            self._build_resolved_parent()
+        self._narrow_node_arrays()
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def _parse(self, tree_text):
+        """Parse indented format phylogenetic tree"""
+        lines = tree_text.strip().split('\n')
+        # path[k]: node id of the latest line at indent <= k on the current
+        # path, so a line at indent d has parent path[d - 1]
+        path = []
+        names, parent_ids, depths = self.names, self.parent, self.depth
+        
+        for line in lines:
+            if not line.strip():
+                continue
+            
+            # Calculate indentation (leading tabs)
+            content = line.lstrip('\t')
+            indent = len(line) - len(content)
+            content = content.strip()
+            parts = content.split('\t')
+            
+            if len(parts) < 1:
+                continue
+            
+            node_name = sys.intern(parts[0].strip())
+            
+            # Skip root node and invalid lines
+            if node_name in ['Y', 'Root', ''] or 'see ' in node_name.lower():
+                continue
+            
+            # Extract SNPs
+            snps = []
+            if len(parts) >= 2:
+                snp_text = parts[1].strip()
+                for snp_part in snp_text.split(','):
+                    snp_part = snp_part.strip()
+                    if snp_part and not snp_part.startswith('('):
+                        for alias in snp_part.split('/'):
+                            alias = alias.strip().rstrip('~^*')
+                            if alias:
+                                snps.append(sys.intern(alias))
+            
+            # Maintain path
+            if indent < len(path):
+                del path[indent:]
+            parent = path[-1] if path else -1
+            if len(path) < indent:
+                path.extend([parent] * (indent - len(path)))
+            
+            node = len(names)
+            path.append(node)
+            
+            names.append(node_name)
+            for snp in snps:
+                snp_id = self._snp_name_to_id.get(snp)
+                if snp_id is None:
+                    snp_id = self._snp_name_to_id[snp] = len(self.snp_names)
+                    self.snp_names.append(snp)
+                self.snp_ids.append(snp_id)
+            self.snp_start.append(len(self.snp_ids))
+            parent_ids.append(parent)
+            depths.append(depths[parent] + 1 if parent >= 0 else 0)
+            self.name_to_id[node_name] = node
+    
+    @staticmethod
+    def _digest(tree_text):
+        return hashlib.blake2b(tree_text.encode('utf-8'), digest_size=16).digest()
+    
+    def pack(self, tree_text):
+        """
+        Serialize the parsed arrays (base64 text), keyed by tree_text digest
+        
+        Layout (zlib-compressed): magic, digest, int32 counts (nodes, snp ids),
+        int32 little-endian arrays parent, depth, snp_start, snp_ids,
+        resolved_parent, ancestor_count,
+        then UTF-8 names and SNP names joined by '\n' and separated by '\0'.
+        A name that extends its parent's name is stored as '\t' + suffix
+        (G2a2b2a1 under G2a2b2a -> '\t1'), so the deep, prefix-sharing
+        labels take a few bytes each.
+        """
+        coded_names = []
+        for node, name in enumerate(self.names):
+            suffix = self.label_suffix(node)
+            coded_names.append(name if suffix is None else '\t' + suffix)
+        
+        arrays = [array('i', [len(self.names), len(self.snp_ids)]),
+                  self.parent, self.depth, self.snp_start, self.snp_ids,
+                  self.resolved_parent, self.ancestor_count]
+        chunks = [self.PACK_MAGIC, self._digest(tree_text)]
+        for values in arrays:
+            values = array('i', values)
+            if sys.byteorder == 'big':
+                values.byteswap()
+            chunks.append(values.tobytes())
+        chunks.append('\0'.join(['\n'.join(coded_names), '\n'.join(self.snp_names)]).encode('utf-8'))
+        
+        return base64.b64encode(zlib.compress(b''.join(chunks), 9)).decode('ascii')
+    
+    @staticmethod
+    def _int32s(data, offset, count):
+        """Little-endian int32 array of count values at data[offset:]"""
+        values = array('i')
+        values.frombytes(data[offset:offset + 4 * count])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+    
+    def _unpack(self, packed, tree_text):
+        """Load arrays from pack() output; False if it does not match tree_text"""
+        data = zlib.decompress(base64.b64decode(packed))
+        if data[:4] != self.PACK_MAGIC:
+            return False
+        if tree_text is not None and data[4:20] != self._digest(tree_text):
+            return False
+        
+        n, n_snp_ids = self._int32s(data, 20, 2)
+        offset = 28
+        for field, count in (('parent', n), ('depth', n), ('snp_start', n + 1),
+                             ('snp_ids', n_snp_ids), ('resolved_parent', n),
+                             ('ancestor_count', n)):
+            setattr(self, field, self._int32s(data, offset, count))
+            offset += 4 * count
+        
+        coded_names, snp_names = data[offset:].decode('utf-8').split('\0')
+        # Parents precede children, so a parent's name is decoded first
+        names, parent = [], self.parent
+        for node, name in enumerate(coded_names.split('\n') if n else []):
+            if name[:1] == '\t':
+                name = names[parent[node]] + name[1:]
+            names.append(sys.intern(name))
+        self.names = names
+        self.snp_names = [sys.intern(snp) for snp in snp_names.split('\n')] if snp_names else []
+        self.name_to_id = {name: node for node, name in enumerate(self.names)}
+        # Only parsing needs the SNP name index; build it on demand
+        self._snp_name_to_id = None
+        
+        return True
+    
+    @property
+    def snp_name_to_id(self):
+        """Map SNP name -> interned SNP id"""
+        if self._snp_name_to_id is None:
+            self._snp_name_to_id = {snp: i for i, snp in enumerate(self.snp_names)}
+        return self._snp_name_to_id
+    
+    def _build_resolved_parent(self):
+        """
+        Resolve each node's parent name to its last occurrence, once
+        
+        A duplicated name can resolve to its own descendant (e.g. the nested
+        F rows), making a cycle; walks stop before revisiting a node, so
+        ancestor_count counts each node of a cycle once.
+        """
+        names, name_to_id, parent = self.names, self.name_to_id, self.parent
+        resolved_parent = array('i', [
+            name_to_id[names[p]] if p >= 0 else -1 for p in parent
+        ])
+        
+        count = array('i', [-1]) * len(names)
+        for start in range(len(names)):
+            # Follow the walk until a known count, the top or a cycle
+            path = []
+            on_path = {}
+            node = start
+            while count[node] < 0 and node not in on_path:
+                if parent[node] < 0:
+                    count[node] = 0
+                    break
+                on_path[node] = len(path)
+                path.append(node)
+                node = resolved_parent[node]
+            
+            if count[node] < 0:
+                cycle = path[on_path[node]:]
+                del path[on_path[node]:]
+                for member in cycle:
+                    count[member] = len(cycle)
+            
+            total = count[node]
+            for member in reversed(path):
+                total += 1
+                count[member] = total
+        
+        self.resolved_parent = resolved_parent
+        self.ancestor_count = count
+    
+    def label_suffix(self, node):
+        """
+        Characters node's name adds to its parent's name (G2a2b2a1 under
+        G2a2b2a -> '1'), or None if it does not extend the parent's name
+        
+        Most ISOGG names extend their parent's, so a label trie over the
+        tree needs only these suffixes; pack() stores names this way.
+        """
+        name, p = self.names[node], self.parent[node]
+        prefix = self.names[p] if p >= 0 else ''
+        if prefix and len(name) > len(prefix) and name.startswith(prefix):
+            return name[len(prefix):]
+        return None
+    
+    def _narrow_node_arrays(self):
+        """Halve node-indexed arrays to int16 when the tree has < 32767 nodes"""
+        if len(self.names) >= 32767:
+            return
+        for field in self.NODE_ARRAYS:
+            setattr(self, field, array('h', getattr(self, field)))
+    
+    def node_snp_ids(self, node):
+        """Interned defining SNP ids of node"""
+        return self.snp_ids[self.snp_start[node]:self.snp_start[node + 1]]
+    
+    def node_snps(self):
+        """Map haplogroup name -> defining SNPs"""
+        snp_names = self.snp_names
+        return {name: [snp_names[i] for i in self.node_snp_ids(node)]
+                for name, node in self.name_to_id.items()}
+    
+    def subtree_sizes(self):
+        """
+        Per-node subtree sizes (node plus descendants), built once
+        
+        Node ids are in preorder, so one reverse sweep adds every node into
+        its parent after all of its own descendants. The subtree of node i
+        is then the id range i .. i + subtree_sizes()[i] - 1.
+        """
+        if self._subtree_sizes is None:
+            sizes = array('i', [1]) * len(self.names)
+            parent = self.parent
+            for node in range(len(sizes) - 1, -1, -1):
+                if parent[node] >= 0:
+                    sizes[parent[node]] += sizes[node]
+            self._subtree_sizes = sizes
+        return self._subtree_sizes
+    
+    def ancestors(self, name):
+        """Get ancestor names of a haplogroup (nearest to farthest)"""
+        current = self.name_to_id.get(name)
+        if current is None:
+            return []
+        
+        names, parent, resolved_parent = self.names, self.parent, self.resolved_parent
+        ancestors = []
+        for _ in range(self.ancestor_count[current]):
+            ancestors.append(names[parent[current]])
+            current = resolved_parent[current]
+        
+        return ancestors
+    
+    def lineage(self, names):
+        """
+        Union of ancestors(name) over names, walking each shared chain once
+        
+        A walk that reaches a node an earlier walk already passed stops
+        there: the rest of its chain is already in the result.
+        """
+        tree_names, parent, resolved_parent = self.names, self.parent, self.resolved_parent
+        ancestor_count, name_to_id = self.ancestor_count, self.name_to_id
+        walked = set()
+        lineage = set()
+        for name in names:
+            current = name_to_id.get(name)
+            if current is None:
+                continue
+            for _ in range(ancestor_count[current]):
+                if current in walked:
+                    break
+                walked.add(current)
+                lineage.add(tree_names[parent[current]])
+                current = resolved_parent[current]
+        return lineage
+
+
 class HaplogroupClassifier:
     """
     Y-chromosome Haplogroup Classifier
@@ -219,7 +692,31 @@ class HaplogroupClassifier:
     # FHaplogroupSpecial handling（basal FDetection）
     F_DEFINING_SNP = 'M89'
     
-    def __init__(self, isogg_file, het_mode="moderate"):
+    # Genotype status -> node status list it is recorded in
+    STATUS_KEYS = {
+        GenotypeStatus.DERIVED: 'derived',
+        GenotypeStatus.ANCESTRAL: 'ancestral',
+        GenotypeStatus.HETEROZYGOUS: 'het'
+    }
+    
+    # check_genotype() status of each GenotypeMatrix 2-bit code, by whether
+    # the VCF alleles are reversed against the index SNP (REF=derived)
+    CODE_STATUS = {
+        False: (GenotypeStatus.ANCESTRAL, GenotypeStatus.MISSING,
+                GenotypeStatus.HETEROZYGOUS, GenotypeStatus.DERIVED),
+        True: (GenotypeStatus.DERIVED, GenotypeStatus.MISSING,
+               GenotypeStatus.HETEROZYGOUS, GenotypeStatus.ANCESTRAL)
+    }
+    
+    # 2-bit code -> one-hot bit, and any non-zero byte -> 1
+    CODE_BITS = bytes([1, 2, 4, 8]) + bytes(252)
+    NONZERO = bytes([0]) + bytes([1]) * 255
+    
+    # Part of the ISOGG cache key; bump whenever _parse_isogg() or the
+    # cached (count, snp_to_info, pos_to_haplo) layout changes
+    ISOGG_CACHE_FORMAT = 1
+    
+    def __init__(self, isogg_file, het_mode="moderate", rebuild_index=False):
         """
         Initialize classifier
         
@@ -227,143 +724,183 @@ class HaplogroupClassifier:
             strict:   Heterozygous treated as missing (most conservative)
             moderate: Heterozygous treated as derived but marked (default)
             lenient:  Heterozygous fully treated as derived
+        rebuild_index: parse isogg_file even if a cached copy is available
         """
         self.het_mode = het_mode
         
         print(f"[1] Parsing phylogenetic tree...")
-        self.phylo_tree, self.node_snps = self._parse_tree(OFFICIAL_TREE)
-        print(f"    Node count: {len(self.phylo_tree)}")
+        self.tree = PhyloTree(OFFICIAL_TREE, OFFICIAL_TREE_DATA)
+        self._node_snps = None
+        self._main_branch = {}  # haplo -> get_main_branch(haplo), filled on use
+        self.node_branch = [self.get_main_branch(name) for name in self.tree.names]
+        # Distinct names below a top-level node, as the original child ->
+        # parent map counted them
+        names = self.tree.names
+        node_count = len({names[node] for node, p in enumerate(self.tree.parent) if p >= 0})
+        print(f"    Node count: {node_count}")
         
         print(f"\n[2] Reading ISOGG index: {isogg_file}")
         self.snp_to_info = {}      # snp_name -> (pos, ref, alt)
         self.pos_to_haplo = defaultdict(list)  # pos -> [(haplo, snp, ref, alt), ...]
-        self._load_isogg(isogg_file)
+        self._load_isogg(isogg_file, rebuild_index)
         
-        # Build node to SNP position mapping
-        self._build_node_snp_positions()
+        # Resolve SNP names/aliases to sites once
+        self._resolve_snp_sites()
+        
+        # Report tree nodes with SNP positions
+        self._check_node_snp_positions()
         
         # Check main branch SNPs
         self._check_main_branch_snps()
     
-    def _parse_tree(self, tree_text):
-        """Parse indented format phylogenetic tree"""
-        phylo_tree = {}  # child -> parent
-        node_snps = {}   # node -> [snp1, snp2, ...]
+    @classmethod
+    def _isogg_cache_file(cls, isogg_file):
+        """
+        Cache path of the parsed ISOGG index, or None without a cache dir
         
-        lines = tree_text.strip().split('\n')
-        path_stack = []  # [(indent, node_name), ...]
+        Keyed by the file's path, size and mtime (no content read) plus the
+        cache format, program and Python versions, so an edited or replaced
+        index, a parser change or a new release gets a fresh entry.
+        """
+        cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        if not os.path.isabs(cache_dir):
+            return None
         
-        for line in lines:
-            if not line.strip():
-                continue
-            
-            # Calculate indentation
-            indent = 0
-            for char in line:
-                if char == '\t':
-                    indent += 1
-                else:
-                    break
-            
-            content = line.strip()
-            parts = content.split('\t')
-            
-            if len(parts) < 1:
-                continue
-            
-            node_name = parts[0].strip()
-            
-            # Skip root node and invalid lines
-            if node_name in ['Y', 'Root', ''] or 'see ' in node_name.lower():
-                continue
-            
-            # Extract SNPs
-            snps = []
-            if len(parts) >= 2:
-                snp_text = parts[1].strip()
-                for snp_part in snp_text.split(','):
-                    snp_part = snp_part.strip()
-                    if snp_part and not snp_part.startswith('('):
-                        for alias in snp_part.split('/'):
-                            alias = alias.strip().rstrip('~^*')
-                            if alias:
-                                snps.append(alias)
-            
-            node_snps[node_name] = snps
-            
-            # Maintain path stack
-            while path_stack and path_stack[-1][0] >= indent:
-                path_stack.pop()
-            
-            if path_stack:
-                parent = path_stack[-1][1]
-                phylo_tree[node_name] = parent
-            
-            path_stack.append((indent, node_name))
+        stat = os.stat(isogg_file)
+        key = (f"{cls.ISOGG_CACHE_FORMAT}\0{VERSION}\0{sys.version_info[:2]}\0"
+               f"{os.path.realpath(isogg_file)}\0{stat.st_size}\0{stat.st_mtime_ns}")
+        digest = hashlib.blake2b(key.encode('utf-8', errors='surrogateescape'), digest_size=8).hexdigest()
+        return os.path.join(cache_dir, 'YHapLZ', f'isogg-{digest}.marshal')
+    
+    def _load_isogg(self, isogg_file, rebuild=False):
+        """
+        Load ISOGG index file, through the parsed-index cache
+        
+        marshal keeps interned names interned, so a cached index still
+        shares its SNP and haplogroup names with the tree; loading it takes
+        about half the time of parsing. Cache problems only cost the parse.
+        """
+        cache_file = self._isogg_cache_file(isogg_file)
+        if cache_file and not rebuild:
+            try:
+                with open(cache_file, 'rb') as f:
+                    count, snp_to_info, pos_to_haplo = marshal.loads(f.read())
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+            else:
+                self.snp_to_info = snp_to_info
+                self.pos_to_haplo = defaultdict(list, pos_to_haplo)
+                print(f"    Loaded SNPs: {count}")
+                return
+        
+        count = self._parse_isogg(isogg_file)
+        print(f"    Loaded SNPs: {count}")
         
-        return phylo_tree, node_snps
+        if cache_file:
+            # Written under a temporary name, so readers never see a partial file
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                with open(tmp_file, 'wb') as f:
+                    marshal.dump((count, self.snp_to_info, dict(self.pos_to_haplo)), f)
+                os.replace(tmp_file, cache_file)
+            except OSError:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
     
-    def _load_isogg(self, isogg_file):
-        """Load ISOGG index file"""
+    def _parse_isogg(self, isogg_file):
+        """Parse ISOGG index file into snp_to_info/pos_to_haplo; returns the SNP count"""
         count = 0
+        snp_to_info, pos_to_haplo = self.snp_to_info, self.pos_to_haplo
+        intern = sys.intern
+        alleles = {}  # mutation text -> (ref, alt); a few dozen distinct values
         
         with open(isogg_file, 'r', encoding='utf-8', errors='ignore') as f:
             header = f.readline()
             sep = '\t' if '\t' in header else ','
+            # One bulk read; rows are then split in a single loop
+            lines = f.read().split('\n')
+        
+        for line in lines:
+            parts = line.strip().split(sep)
+            if len(parts) < 7:
+                continue
             
-            for line in f:
-                parts = line.strip().split(sep)
-                if len(parts) < 7:
-                    continue
-                
-                snp_name = parts[0].strip().rstrip('~^*')
-                haplo = parts[1].strip().rstrip('~^*')
-                pos_str = parts[4].strip()
-                mutation = parts[6].strip() if len(parts) > 6 else ""
-                
-                if not pos_str or '..' in pos_str:
-                    continue
-                
-                try:
-                    pos = int(pos_str)
-                except:
-                    continue
-                
+            # Rows without a single Build 37 position are skipped before
+            # any other field is touched
+            pos_str = parts[4].strip()
+            if not pos_str or '..' in pos_str:
+                continue
+            try:
+                pos = int(pos_str)
+            except ValueError:
+                continue
+            
+            # Interned, so repeated names share one object with the tree
+            snp_name = intern(parts[0].strip().rstrip('~^*'))
+            haplo = intern(parts[1].strip().rstrip('~^*'))
+            
+            mutation = parts[6].strip()
+            site_alleles = alleles.get(mutation)
+            if site_alleles is None:
                 ref, alt = '', ''
                 if '->' in mutation:
-                    try:
-                        ref, alt = mutation.split('->')[:2]
-                        ref, alt = ref.strip().upper(), alt.strip().upper()
-                    except:
-                        pass
-                
-                self.snp_to_info[snp_name] = (pos, ref, alt)
-                self.pos_to_haplo[pos].append((haplo, snp_name, ref, alt))
-                count += 1
-                
-                # Process aliases
-                if len(parts) > 2:
-                    for alt_name in parts[2].split(';'):
-                        alt_name = alt_name.strip().rstrip('~^*')
-                        if alt_name and alt_name not in self.snp_to_info:
-                            self.snp_to_info[alt_name] = (pos, ref, alt)
+                    ref, alt = mutation.split('->')[:2]
+                    ref, alt = ref.strip().upper(), alt.strip().upper()
+                site_alleles = alleles[mutation] = (ref, alt)
+            ref, alt = site_alleles
+            
+            # One site tuple per row, shared by the name and its aliases
+            site = (pos, ref, alt)
+            snp_to_info[snp_name] = site
+            pos_to_haplo[pos].append((haplo, snp_name, ref, alt))
+            count += 1
+            
+            # Process aliases
+            if parts[2]:
+                for alt_name in parts[2].split(';'):
+                    alt_name = alt_name.strip().rstrip('~^*')
+                    if alt_name and alt_name not in snp_to_info:
+                        snp_to_info[intern(alt_name)] = site
         
-        print(f"    Loaded SNPs: {count}")
+        return count
     
-    def _build_node_snp_positions(self):
-        """Build SNP position mapping for tree nodes"""
-        self.node_snp_positions = {}
+    def _resolve_snp_sites(self):
+        """
+        Resolve SNP names (including aliases) against the index once
         
-        for node, snps in self.node_snps.items():
-            positions = []
-            for snp in snps:
-                if snp in self.snp_to_info:
-                    pos, ref, alt = self.snp_to_info[snp]
-                    positions.append((snp, pos, ref, alt))
-            self.node_snp_positions[node] = positions
+        snp_sites[snp_id]:     (pos, ref, alt) of interned tree SNP, or None
+        branch_sites[branch]:  (pos, ref, alt) of main branch defining SNP, or None
+        f_site:                (pos, ref, alt) of F defining SNP, or None
+        """
+        self.snp_sites = [self.snp_to_info.get(snp) for snp in self.tree.snp_names]
+        self.branch_sites = {
+            branch: self.snp_to_info.get(self.MAIN_BRANCH_DEFINING_SNPS.get(branch))
+            for branch in self.MAIN_BRANCHES
+        }
+        self.f_site = self.snp_to_info.get(self.F_DEFINING_SNP)
+    
+    def _check_node_snp_positions(self):
+        """Count tree nodes with at least one defining SNP in the index"""
+        tree = self.tree
+        snp_sites = self.snp_sites
+        nodes_with_pos = sum(1 for node in tree.name_to_id.values()
+                             if any(snp_sites[i] for i in tree.node_snp_ids(node)))
+        print(f"    {nodes_with_pos}/{len(tree.name_to_id)} tree nodes have SNP positions")
+    
+    @property
+    def node_snps(self):
+        """
+        Map haplogroup name -> defining SNPs, built on first use
         
-        nodes_with_pos = sum(1 for p in self.node_snp_positions.values() if p)
-        print(f"    {nodes_with_pos}/{len(self.node_snps)} tree nodes have SNP positions")
+        Classification reads the tree's snp_start/snp_ids arrays directly;
+        this per-name list view exists for callers that want names.
+        """
+        if self._node_snps is None:
+            self._node_snps = self.tree.node_snps()
+        return self._node_snps
     
     def _check_main_branch_snps(self):
         """Check availability of main branch defining SNPs"""
@@ -371,32 +908,44 @@ class HaplogroupClassifier:
         
         for branch in self.MAIN_BRANCHES:
             snp = self.MAIN_BRANCH_DEFINING_SNPS.get(branch, '')
-            if snp and snp in self.snp_to_info:
-                pos = self.snp_to_info[snp][0]
+            if self.branch_sites[branch]:
+                pos = self.branch_sites[branch][0]
                 print(f"      {branch}: ✓ {snp} @ {pos}")
             else:
                 print(f"      {branch}: ✗ {snp} (Needs inference from downstream)")
     
     def get_ancestors(self, node):
         """Get all ancestors of node (nearest to farthest)"""
-        ancestors = []
-        current = node
-        seen = set()
+        return self.tree.ancestors(node)
+    
+    def get_node_snp_positions(self, node):
+        """
+        Defining SNPs of a node with index sites, read from the tree's SNP CSR
         
-        while current in self.phylo_tree and current not in seen:
-            seen.add(current)
-            parent = self.phylo_tree[current]
-            ancestors.append(parent)
-            current = parent
+        Returns: [(snp, pos, ref, alt), ...]
+        """
+        tree = self.tree
+        node_id = tree.name_to_id.get(node)
+        if node_id is None:
+            return []
         
-        return ancestors
+        return [(tree.snp_names[i],) + self.snp_sites[i]
+                for i in tree.node_snp_ids(node_id) if self.snp_sites[i]]
     
     def get_depth(self, node):
         """Get node depth in tree"""
-        return len(self.get_ancestors(node))
+        node_id = self.tree.name_to_id.get(node)
+        return self.tree.ancestor_count[node_id] if node_id is not None else 0
     
     def get_main_branch(self, haplo):
-        """Extract main branch from haplogroup name"""
+        """Extract main branch from haplogroup name (memoized per name)"""
+        branch = self._main_branch.get(haplo, False)
+        if branch is False:
+            branch = self._main_branch[haplo] = self._match_main_branch(haplo)
+        return branch
+    
+    def _match_main_branch(self, haplo):
+        """Match haplogroup name against the main branch prefixes"""
         if not haplo:
             return None
         
@@ -420,6 +969,193 @@ class HaplogroupClassifier:
         
         return None
     
+    def match_sites(self, positions):
+        """
+        Resolve genotyped positions against the ISOGG index once
+        
+        Returns: [(pos, [(haplo, snp, ref, alt), ...], decoded), ...] in index
+        order, restricted to positions present in the genotype data.
+        decoded caches _decode_call() results per distinct call at the site,
+        so samples sharing a site list decode each call only once.
+        """
+        return [(pos, entries, {}) for pos, entries in self.pos_to_haplo.items()
+                if pos in positions]
+    
+    def _decode_call(self, call, entries):
+        """
+        Decode one VCF call against every index entry at its site
+        
+        Returns: (is_het, derived, statuses)
+            derived:  [(haplo, snp_name), ...] for derived entries
+            statuses: [(haplo, snp_name, status_key), ...] for entries recorded
+                      in node status ('derived'/'ancestral'/'het')
+        """
+        gt, vcf_ref, vcf_alt = call
+        derived = []
+        statuses = []
+        for haplo, snp_name, ref, alt in entries:
+            status = self.check_genotype(gt, vcf_ref, vcf_alt, ref, alt)
+            status_key = self.STATUS_KEYS.get(status)
+            if status_key:
+                statuses.append((haplo, snp_name, status_key))
+            if self.is_derived(status):
+                derived.append((haplo, snp_name))
+        
+        return gt in ['0/1', '0|1', '1/0', '1|0'], derived, statuses
+    
+    def _call_evidence(self, sites, sample_geno):
+        """
+        Step 1 of classify_sample() from per-position calls
+        
+        Returns: (het_count, derived_haplos, node_status)
+            derived_haplos: {haplo: [(snp, pos), ...]}
+            node_status:    callable(nodes) -> all_node_status of those nodes
+        """
+        het_count = 0
+        derived_haplos = defaultdict(list)  # haplo -> [(snp, pos), ...]
+        observed = []  # Node statuses per called site, recorded in Step 4
+        
+        for pos, entries, decoded in sites:
+            call = sample_geno.get(pos)
+            if call is None:
+                continue
+            
+            if call not in decoded:
+                decoded[call] = self._decode_call(call, entries)
+            is_het, derived, statuses = decoded[call]
+            
+            # Count heterozygous
+            if is_het:
+                het_count += 1
+            
+            for haplo, snp_name in derived:
+                derived_haplos[haplo].append((snp_name, pos))
+            
+            if statuses:
+                observed.append(statuses)
+        
+        return het_count, derived_haplos, partial(self._node_status, observed)
+    
+    def _node_status(self, observed, nodes):
+        """
+        Record status of checked nodes, restricted to the given node names
+        
+        Only the ancestor chains of the main-branch candidates are ever
+        validated, so nodes off those lineages are skipped rather than
+        recorded for every ancestral call in the sample.
+        
+        Returns: {haplo: {'derived': [...], 'ancestral': [...], 'het': [...], 'missing': []}}
+        """
+        all_node_status = {}
+        for statuses in observed:
+            for haplo, snp_name, status_key in statuses:
+                if haplo not in nodes:
+                    continue
+                node_status = all_node_status.get(haplo)
+                if node_status is None:
+                    node_status = all_node_status[haplo] = {
+                        'derived': [], 'ancestral': [], 'het': [], 'missing': []
+                    }
+                node_status[status_key].append(snp_name)
+        
+        return all_node_status
+    
+    def _column_index(self, sites, matrix):
+        """
+        Per-batch lookup structures for classifying GenotypeMatrix columns
+        
+        A sample is a column of 2-bit codes, one byte per site. The four
+        codes are fixed calls, so check_genotype() reduces to whether the
+        site's alleles are reversed against the index SNP; each entry is
+        matched once and its outcome for every code is tabulated.
+        
+        Returns: (derived_sites, derived_mask, node_sites)
+            derived_sites[i][code]: [(haplo, (snp_name, pos)), ...] derived at
+                                    site i, evidence tuples shared by all samples
+            derived_mask:           int whose byte i has bit `code` set for each
+                                    code with derived entries at site i
+            node_sites[haplo]:      [(i, snp_name, status_keys), ...] with
+                                    status_keys[code] the node status list
+                                    ('derived'/'ancestral'/'het', or None)
+        """
+        # Allele orientation -> (status_keys, derived codes)
+        patterns = {}
+        for reverse in (False, True):
+            statuses = self.CODE_STATUS[reverse]
+            patterns[reverse] = (
+                tuple(self.STATUS_KEYS.get(status) for status in statuses),
+                [code for code, status in enumerate(statuses) if self.is_derived(status)]
+            )
+        
+        derived_sites = []
+        mask = bytearray(len(sites))
+        node_sites = defaultdict(list)
+        
+        for i, (pos, entries, _) in enumerate(sites):
+            _, vcf_ref, vcf_alt = matrix.calls[matrix.site_index[pos]][0]
+            vcf_ref = vcf_ref.upper()
+            vcf_alt = vcf_alt.upper() if vcf_alt != '.' else ''
+            
+            derived = ([], [], [], [])
+            for haplo, snp_name, ref, alt in entries:
+                evidence = (snp_name, pos)
+                reverse = (bool(ref and alt)
+                           and not (vcf_ref == ref.upper() and vcf_alt == alt.upper())
+                           and vcf_ref == alt.upper() and vcf_alt == ref.upper())
+                status_keys, derived_codes = patterns[reverse]
+                
+                for code in derived_codes:
+                    derived[code].append((haplo, evidence))
+                    mask[i] |= 1 << code
+                node_sites[haplo].append((i, snp_name, status_keys))
+            derived_sites.append(derived)
+        
+        return derived_sites, int.from_bytes(mask, 'little'), node_sites
+    
+    def _column_evidence(self, column, sites, index):
+        """
+        Step 1 of classify_sample() from a GenotypeMatrix column
+        
+        Derived sites are found with one bitwise AND of the column (as
+        one-hot bytes) against the batch's derived mask, so only sites
+        with derived calls are visited, and each hit appends the batch's
+        prebuilt evidence for that site and code.
+        
+        index: output of _column_index() for sites
+        Returns: see _call_evidence()
+        """
+        derived_sites, derived_mask, node_sites = index
+        derived_haplos = defaultdict(list)  # haplo -> [(snp, pos), ...]
+        
+        hits = int.from_bytes(column.translate(self.CODE_BITS), 'little') & derived_mask
+        if hits:
+            hits = hits.to_bytes(len(column), 'little').translate(self.NONZERO)
+            i = hits.find(1)
+            while i >= 0:
+                for haplo, evidence in derived_sites[i][column[i]]:
+                    derived_haplos[haplo].append(evidence)
+                i = hits.find(1, i + 1)
+        
+        het_count = column.count(GenotypeMatrix.HET_CODE)
+        return het_count, derived_haplos, partial(self._column_node_status, column, node_sites)
+    
+    def _column_node_status(self, column, node_sites, nodes):
+        """Record status of the given nodes from a GenotypeMatrix column (see _node_status)"""
+        all_node_status = {}
+        for haplo in nodes:
+            for i, snp_name, status_keys in node_sites.get(haplo, ()):
+                status_key = status_keys[column[i]]
+                if not status_key:
+                    continue
+                node_status = all_node_status.get(haplo)
+                if node_status is None:
+                    node_status = all_node_status[haplo] = {
+                        'derived': [], 'ancestral': [], 'het': [], 'missing': []
+                    }
+                node_status[status_key].append(snp_name)
+        
+        return all_node_status
+    
     def check_genotype(self, gt, vcf_ref, vcf_alt, exp_ref, exp_alt):
         """
         Check genotype status
@@ -495,7 +1231,7 @@ class HaplogroupClassifier:
             'missing_snps': [...]
         }
         """
-        positions = self.node_snp_positions.get(node, [])
+        positions = self.get_node_snp_positions(node)
         
         derived_snps = []
         ancestral_snps = []
@@ -537,7 +1273,7 @@ class HaplogroupClassifier:
             'missing_snps': missing_snps
         }
     
-    def classify_sample(self, sample, sample_geno):
+    def classify_sample(self, sample, sample_geno, sites=None, evidence=None):
         """
         Classify single sample
         
@@ -546,44 +1282,21 @@ class HaplogroupClassifier:
         2. Group by main branch
         3. Validate ancestor chain for each candidate
         4. Select deepest validated node
+        
+        sites: output of match_sites() for the sample's positions; samples
+               sharing it also share its genotype decoding
+        evidence: Step 1 result (het_count, derived_haplos, node_status), if
+               already collected (see _column_evidence)
         """
-        het_count = 0
+        if sites is None:
+            sites = self.match_sites(sample_geno)
         
         # ========================================
         # Step 1: Collect all derived SNPs/haplogroups
         # ========================================
-        derived_haplos = defaultdict(list)  # haplo -> [(snp, pos), ...]
-        all_node_status = {}  # Record status of all checked nodes
-        
-        for pos, entries in self.pos_to_haplo.items():
-            if pos not in sample_geno:
-                continue
-            
-            gt, vcf_ref, vcf_alt = sample_geno[pos]
-            
-            # Count heterozygous
-            if gt in ['0/1', '0|1', '1/0', '1|0']:
-                het_count += 1
-            
-            for haplo, snp_name, ref, alt in entries:
-                status = self.check_genotype(gt, vcf_ref, vcf_alt, ref, alt)
-                
-                # Record node status
-                if haplo not in all_node_status:
-                    all_node_status[haplo] = {
-                        'derived': [], 'ancestral': [], 'het': [], 'missing': []
-                    }
-                
-                if status == GenotypeStatus.DERIVED:
-                    all_node_status[haplo]['derived'].append(snp_name)
-                elif status == GenotypeStatus.ANCESTRAL:
-                    all_node_status[haplo]['ancestral'].append(snp_name)
-                elif status == GenotypeStatus.HETEROZYGOUS:
-                    all_node_status[haplo]['het'].append(snp_name)
-                
-                # Determine if derived
-                if self.is_derived(status):
-                    derived_haplos[haplo].append((snp_name, pos))
+        if evidence is None:
+            evidence = self._call_evidence(sites, sample_geno)
+        het_count, derived_haplos, node_status = evidence
         
         if not derived_haplos:
             return self._make_result(
@@ -618,15 +1331,11 @@ class HaplogroupClassifier:
         # Check main branch defining SNPs
         branch_direct_status = {}
         for branch in self.MAIN_BRANCHES:
-            snp = self.MAIN_BRANCH_DEFINING_SNPS.get(branch)
-            if snp and snp in self.snp_to_info:
-                pos, ref, alt = self.snp_to_info[snp]
-                if pos in sample_geno:
-                    gt, vcf_ref, vcf_alt = sample_geno[pos]
-                    status = self.check_genotype(gt, vcf_ref, vcf_alt, ref, alt)
-                    branch_direct_status[branch] = status
-                else:
-                    branch_direct_status[branch] = GenotypeStatus.MISSING
+            site = self.branch_sites[branch]
+            if site and site[0] in sample_geno:
+                pos, ref, alt = site
+                gt, vcf_ref, vcf_alt = sample_geno[pos]
+                branch_direct_status[branch] = self.check_genotype(gt, vcf_ref, vcf_alt, ref, alt)
             else:
                 branch_direct_status[branch] = GenotypeStatus.MISSING
         
@@ -669,11 +1378,10 @@ class HaplogroupClassifier:
         # Special handling: detect basal F
         # If no main branch found but M89 derived, may be rare basal F
         if not main_branch:
-            if self.F_DEFINING_SNP in self.snp_to_info:
-                f_pos = self.snp_to_info[self.F_DEFINING_SNP][0]
+            if self.f_site:
+                f_pos, f_ref, f_alt = self.f_site
                 if f_pos in sample_geno:
                     gt, vcf_ref, vcf_alt = sample_geno[f_pos]
-                    f_ref, f_alt = self.snp_to_info[self.F_DEFINING_SNP][1], self.snp_to_info[self.F_DEFINING_SNP][2]
                     f_status = self.check_genotype(gt, vcf_ref, vcf_alt, f_ref, f_alt)
                     if self.is_derived(f_status):
                         # M89Derived but no downstream branch evidence = basal F
@@ -697,45 +1405,24 @@ class HaplogroupClassifier:
         # Sort by depth and SNP count
         candidates.sort(key=lambda x: (x['depth'], x['n_snps']), reverse=True)
         
+        # Only lineages leading to a candidate can conflict, prune the rest
+        lineage = self.tree.lineage([cand['haplo'] for cand in candidates])
+        all_node_status = node_status(lineage)
+        
         # Validate ancestor chain for each candidate
         best_haplo = main_branch
         best_n_snps = 0
         best_evidence = []
         ancestor_conflicts = []
         
+        chain_checks = {}  # haplo -> (conflicts, conflict_count)
+        
         for cand in candidates:
             haplo = cand['haplo']
-            ancestors = self.get_ancestors(haplo)
+            conflicts, _ = chain_checks[haplo] = self._check_ancestor_chain(
+                haplo, main_branch, all_node_status)
             
-            # Only check ancestors within main branch
-            relevant_ancestors = []
-            for anc in ancestors:
-                if anc == main_branch:
-                    break
-                if self.get_main_branch(anc) == main_branch or anc == main_branch:
-                    relevant_ancestors.append(anc)
-            
-            # Check ancestor chain
-            chain_valid = True
-            conflicts = []
-            
-            for anc in relevant_ancestors:
-                if anc in all_node_status:
-                    anc_info = all_node_status[anc]
-                    has_derived = len(anc_info['derived']) > 0
-                    has_ancestral = len(anc_info['ancestral']) > 0
-                    has_het = len(anc_info['het']) > 0
-                    
-                    # Key: if ancestor is clearly ancestral with no derived evidence
-                    if has_ancestral and not has_derived:
-                        # Can heterozygous save it?
-                        if has_het and self.het_mode in ['moderate', 'lenient']:
-                            pass  # Acceptable but marked
-                        else:
-                            chain_valid = False
-                            conflicts.append(f"{anc}(ancestral)")
-            
-            if chain_valid:
+            if not conflicts:
                 best_haplo = haplo
                 best_n_snps = cand['n_snps']
                 best_evidence = cand['snps'][:5]
@@ -749,14 +1436,10 @@ class HaplogroupClassifier:
             min_conflicts = float('inf')
             for cand in candidates:
                 haplo = cand['haplo']
-                ancestors = self.get_ancestors(haplo)
-                
-                conflict_count = 0
-                for anc in ancestors:
-                    if anc in all_node_status:
-                        anc_info = all_node_status[anc]
-                        if anc_info['ancestral'] and not anc_info['derived']:
-                            conflict_count += 1
+                if haplo not in chain_checks:
+                    chain_checks[haplo] = self._check_ancestor_chain(
+                        haplo, main_branch, all_node_status)
+                conflict_count = chain_checks[haplo][1]
                 
                 if conflict_count < min_conflicts:
                     min_conflicts = conflict_count
@@ -811,6 +1494,137 @@ class HaplogroupClassifier:
             confidence, het_count, best_evidence, '', diagnostics
         )
     
+    def classify_samples(self, samples, sample_geno, jobs=1):
+        """
+        Classify a batch of samples from the same VCF
+        
+        Sites are resolved against the index once and each distinct call at
+        a site is decoded once for the whole batch. For a GenotypeMatrix,
+        samples with identical calls at the index sites (e.g. technical
+        duplicates) are classified once. Yields one result per sample, in
+        order.
+        
+        jobs: number of worker processes; samples are split into contiguous
+              chunks, each classified by a worker against the batch
+              structures built here once
+        """
+        if not samples:
+            return
+        
+        batch = self._prepare_batch(samples, sample_geno)
+        
+        if jobs > 1 and len(samples) > 1:
+            chunksize = -(-len(samples) // (jobs * 4))
+            chunks = [samples[i:i + chunksize] for i in range(0, len(samples), chunksize)]
+            state = (self, sample_geno, batch)
+            if multiprocessing.get_start_method() != 'fork':
+                # spawn/forkserver pickle initargs once per worker; pickle
+                # the classifier, genotypes and batch once for all of them
+                state = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+            with ProcessPoolExecutor(jobs, initializer=_init_worker,
+                                     initargs=(state,)) as executor:
+                for results in executor.map(_classify_chunk, chunks):
+                    yield from results
+            return
+        
+        yield from self._classify_batch(samples, sample_geno, batch)
+    
+    def _prepare_batch(self, samples, sample_geno):
+        """
+        Per-batch structures shared by all samples of classify_samples()
+        
+        Returns: (sites, rows, index); rows and index are None unless
+        sample_geno is a GenotypeMatrix
+        """
+        # All samples share the VCF site list
+        sites = self.match_sites(sample_geno[samples[0]])
+        
+        rows = index = None
+        if isinstance(sample_geno, GenotypeMatrix):
+            site_index = sample_geno.site_index
+            rows = [sample_geno.rows[site_index[pos]] for pos, _, _ in sites]
+            index = self._column_index(sites, sample_geno)
+        return sites, rows, index
+    
+    def _classify_batch(self, samples, sample_geno, batch):
+        """Classify samples against _prepare_batch() output, yielding results in order"""
+        sites, rows, index = batch
+        cache = {}  # genotype digest -> result
+        
+        if rows is not None:
+            # Index sites with calls packed as missing that are not missing
+            site_index, raw_gts = sample_geno.site_index, sample_geno.raw_gts
+            raw_sites = [(i, raw_gts[site_index[pos]]) for i, (pos, _, _) in enumerate(sites)
+                         if raw_gts[site_index[pos]]]
+        
+        for sample in samples:
+            if rows is None:
+                yield self.classify_sample(sample, sample_geno[sample], sites)
+                continue
+            
+            column = sample_geno.column(sample, rows)
+            digest = hashlib.blake2b(column, digest_size=16)
+            if raw_sites:
+                # They classify like missing calls apart from their main
+                # branch status, so they are part of the key
+                sample_index = sample_geno.sample_index[sample]
+                digest.update(repr([(i, gts[sample_index]) for i, gts in raw_sites
+                                    if sample_index in gts]).encode())
+            key = digest.digest()
+            if key in cache:
+                yield dict(cache[key], sample=sample)
+                continue
+            
+            evidence = self._column_evidence(column, sites, index)
+            result = cache[key] = self.classify_sample(
+                sample, sample_geno[sample], sites, evidence)
+            yield result
+    
+    def _check_ancestor_chain(self, haplo, main_branch, all_node_status):
+        """
+        Walk ancestor chain of a candidate once over the tree arrays
+        
+        Returns: (conflicts, conflict_count)
+            conflicts:      ancestors within main branch that are ancestral
+                            (not rescued by heterozygous evidence)
+            conflict_count: all ancestors that are ancestral without derived
+                            evidence, used to rank conflicting candidates
+        """
+        tree = self.tree
+        het_rescues = self.het_mode in ['moderate', 'lenient']
+        conflicts = []
+        conflict_count = 0
+        in_branch = True  # Still below main branch node
+        
+        current = tree.name_to_id.get(haplo)
+        steps = tree.ancestor_count[current] if current is not None else 0
+        names, parents, resolved_parent = tree.names, tree.parent, tree.resolved_parent
+        node_branch = self.node_branch
+        
+        for _ in range(steps):
+            parent = parents[current]
+            anc = names[parent]
+            current = resolved_parent[current]
+            
+            if anc == main_branch:
+                in_branch = False
+            
+            anc_info = all_node_status.get(anc)
+            if anc_info is None:
+                continue
+            
+            # Key: if ancestor is clearly ancestral with no derived evidence
+            if anc_info['ancestral'] and not anc_info['derived']:
+                conflict_count += 1
+                
+                # Only ancestors within main branch break the chain;
+                # heterozygous evidence can save them (acceptable but marked)
+                if in_branch and node_branch[parent] == main_branch:
+                    if not (anc_info['het'] and het_rescues):
+                        conflicts.append(f"{anc}(ancestral)")
+        
+        return conflicts, conflict_count
+    
     def _make_result(self, sample, main_branch, haplo, n_snps, 
                      confidence, het_count, evidence, note, diagnostics):
         """Build result dictionary"""
@@ -827,46 +1641,131 @@ class HaplogroupClassifier:
         }
 
 
+# Classifier and genotypes of a worker process, set once by _init_worker
+_worker_state = None
+
+
+def _init_worker(state):
+    """Keep classifier, genotypes and batch structures in the worker across chunks"""
+    global _worker_state
+    if isinstance(state, bytes):
+        state = pickle.loads(state)
+    _worker_state = state
+
+
+def _classify_chunk(samples):
+    """Classify one chunk of samples in a worker process"""
+    classifier, sample_geno, batch = _worker_state
+    return list(classifier._classify_batch(samples, sample_geno, batch))
+
+
 def load_vcf(vcf_file):
-    """Load VCF file"""
-    opener = open
-    mode = 'r'
-    if vcf_file.endswith('.gz'):
-        opener = gzip.open
-        mode = 'rt'
+    """
+    Load VCF file
     
+    Returns: (samples, genotypes, y_count)
+        genotypes: GenotypeMatrix, genotypes[sample] -> {pos: (gt, ref, alt)}
+    """
     samples = []
-    sample_geno = defaultdict(dict)
+    genotypes = GenotypeMatrix(samples)
+    gt_codes = {gt.encode(): code for gt, code in GenotypeMatrix.GT_CODES.items()}
+    missing = GenotypeMatrix.MISSING_CODE
+    missing_gts = {b'./.', b'.', b''}
+    y_chroms = {b'Y', b'chrY', b'24', b'chr24'}
     y_count = 0
     
-    with opener(vcf_file, mode) as f:
+    # Read raw bytes through a large buffer; only the columns used are decoded
+    if vcf_file.endswith('.gz'):
+        f = io.BufferedReader(gzip.open(vcf_file, 'rb'), buffer_size=1 << 20)
+    else:
+        f = open(vcf_file, 'rb', buffering=1 << 20)
+    
+    with f:
         for line in f:
-            if line.startswith('##'):
+            if line.startswith(b'##'):
                 continue
-            if line.startswith('#CHROM'):
-                parts = line.strip().split('\t')
+            if line.startswith(b'#CHROM'):
+                parts = line.decode().strip().split('\t')
                 samples = parts[9:]
+                genotypes = GenotypeMatrix(samples)
                 continue
             
-            parts = line.strip().split('\t')
-            if len(parts) < 10:
+            # Check chromosome before splitting the sample columns
+            chrom = line[:line.find(b'\t')].strip()
+            if chrom not in y_chroms:
                 continue
             
-            chrom = parts[0]
-            if chrom not in ['Y', 'chrY', '24', 'chr24']:
+            parts = line.strip().split(b'\t')
+            if len(parts) < 10:
                 continue
             
             pos = int(parts[1])
-            ref = parts[3]
-            alt = parts[4]
+            ref = parts[3].decode()
+            alt = parts[4].decode()
             
-            for i, sample in enumerate(samples):
-                gt = parts[9 + i].split(':')[0]
-                sample_geno[sample][pos] = (gt, ref, alt)
+            gts = [field.split(b':', 1)[0] for field in parts[9:9 + len(samples)]]
+            codes = bytes([gt_codes.get(gt, missing) for gt in gts])
+            
+            # Keep other calls (e.g. '1/2') that are packed as missing
+            raw_gts = None
+            if missing in codes:
+                raw_gts = {i: gt.decode() for i, gt in enumerate(gts)
+                           if gt not in gt_codes and gt not in missing_gts} or None
+            genotypes.add_site(pos, ref, alt, codes, raw_gts)
             
             y_count += 1
     
-    return samples, sample_geno, y_count
+    return samples, genotypes, y_count
+
+
+def load_plink(bfile, positions=None):
+    """
+    Load PLINK binary fileset (.bed/.bim/.fam)
+    
+    The .bed file is memory-mapped and only Y-chromosome variants (restricted
+    to positions, if given) are read; their packed rows are used as-is apart
+    from swapping the homozygous codes. Alleles follow PLINK's VCF export:
+    REF = A2, ALT = A1.
+    
+    Returns: (samples, genotypes, y_count)
+        genotypes: GenotypeMatrix, genotypes[sample] -> {pos: (gt, ref, alt)}
+    Raises ValueError if the .bed file is not a variant-major .bed file or is
+    shorter than the .bim file implies.
+    """
+    y_chroms = {'Y', 'chrY', '24', 'chr24'}
+    y_count = 0
+    
+    with open(bfile + '.fam') as f:
+        samples = [line.split()[1] for line in f if line.strip()]
+    genotypes = GenotypeMatrix(samples)
+    row_bytes = genotypes.row_bytes
+    
+    with open(bfile + '.bed', 'rb') as f:
+        # An empty file cannot be mapped
+        if f.read(3) != b'\x6c\x1b\x01':
+            raise ValueError(f"{bfile}.bed is not a variant-major PLINK .bed file")
+        bed = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    with bed, open(bfile + '.bim') as bim:
+        
+        for variant, line in enumerate(bim):
+            parts = line.split()
+            if len(parts) < 6 or parts[0] not in y_chroms:
+                continue
+            
+            y_count += 1
+            pos = int(parts[3])
+            if positions is not None and pos not in positions:
+                continue
+            
+            offset = 3 + variant * row_bytes
+            if offset + row_bytes > len(bed):
+                raise ValueError(f"{bfile}.bed is truncated: no genotypes for "
+                                 f"variant {variant + 1} of {bfile}.bim")
+            row = bed[offset:offset + row_bytes].translate(GenotypeMatrix.BED_FLIP)
+            genotypes.add_row(pos, parts[5], parts[4], row)
+    
+    return samples, genotypes, y_count
 
 
 def print_summary(results, het_mode):
@@ -921,19 +1820,21 @@ def save_results(results, output_dir, het_mode):
     
     # Main result file
     result_file = os.path.join(output_dir, 'Y_haplogroup_result_v4.0.txt')
-    with open(result_file, 'w') as f:
-        f.write("Sample\tMain_Branch\tHaplogroup\tConfidence\tN_SNPs\t")
-        f.write("Het_Count\tMain_Status\tEvidence\tConflicts\n")
+    # Format all rows first and write them in one call
+    lines = ["Sample\tMain_Branch\tHaplogroup\tConfidence\tN_SNPs\t"
+             "Het_Count\tMain_Status\tEvidence\tConflicts\n"]
+    for r in results:
+        evidence = ','.join(r['evidence'][:5]) if r['evidence'] else '-'
+        diag = r.get('diagnostics', {})
+        main_status = diag.get('main_branch_status', '-')
+        conflicts = ','.join(diag.get('ancestor_conflicts', [])) or '-'
         
-        for r in results:
-            evidence = ','.join(r['evidence'][:5]) if r['evidence'] else '-'
-            diag = r.get('diagnostics', {})
-            main_status = diag.get('main_branch_status', '-')
-            conflicts = ','.join(diag.get('ancestor_conflicts', [])) or '-'
-            
-            f.write(f"{r['sample']}\t{r['main_branch']}\t{r['haplogroup']}\t")
-            f.write(f"{r['confidence']:.3f}\t{r['n_snps']}\t{r['het_count']}\t")
-            f.write(f"{main_status}\t{evidence}\t{conflicts}\n")
+        lines.append(f"{r['sample']}\t{r['main_branch']}\t{r['haplogroup']}\t"
+                     f"{r['confidence']:.3f}\t{r['n_snps']}\t{r['het_count']}\t"
+                     f"{main_status}\t{evidence}\t{conflicts}\n")
+    
+    with open(result_file, 'w') as f:
+        f.write(''.join(lines))
     
     # Summary file
     summary_file = os.path.join(output_dir, 'Y_haplogroup_summary_v4.0.txt')
@@ -1002,17 +1903,28 @@ Heterozygosity handling modes:
         '''
     )
     
-    parser.add_argument('-v', '--vcf', required=True, help='VCF file')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('-v', '--vcf', help='VCF file')
+    source.add_argument('-b', '--bfile', help='PLINK binary fileset prefix (.bed/.bim/.fam)')
     parser.add_argument('-i', '--isogg', required=True, help='ISOGG indexdata.csv')
     parser.add_argument('-o', '--output', required=True, help='Output directory')
     parser.add_argument('--het-mode', choices=['strict', 'moderate', 'lenient'],
                         default='moderate', help='Heterozygosity handling mode (Default: moderate)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Worker processes for classification (Default: 1)')
+    parser.add_argument('--rebuild-index', action='store_true',
+                        help='Re-parse the ISOGG index instead of using its cached copy')
     
     args = parser.parse_args()
     
-    if not os.path.exists(args.vcf):
+    if args.vcf and not os.path.exists(args.vcf):
         print(f"Error: {args.vcf} Does not exist")
         sys.exit(1)
+    if args.bfile:
+        for ext in ('.bed', '.bim', '.fam'):
+            if not os.path.exists(args.bfile + ext):
+                print(f"Error: {args.bfile + ext} Does not exist")
+                sys.exit(1)
     if not os.path.exists(args.isogg):
         print(f"Error: {args.isogg} Does not exist")
         sys.exit(1)
@@ -1022,11 +1934,19 @@ Heterozygosity handling modes:
     print("=" * 70)
     
     # Initialize classifier
-    classifier = HaplogroupClassifier(args.isogg, args.het_mode)
+    classifier = HaplogroupClassifier(args.isogg, args.het_mode, args.rebuild_index)
     
     # LoadVCF
-    print(f"\n[3] Reading VCF: {args.vcf}")
-    samples, sample_geno, y_count = load_vcf(args.vcf)
+    if args.bfile:
+        print(f"\n[3] Reading PLINK: {args.bfile}")
+        try:
+            samples, sample_geno, y_count = load_plink(args.bfile, classifier.pos_to_haplo)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    else:
+        print(f"\n[3] Reading VCF: {args.vcf}")
+        samples, sample_geno, y_count = load_vcf(args.vcf)
     print(f"    Sample count: {len(samples)}")
     print(f"    Y-chromosome sites: {y_count}")
     
@@ -1038,11 +1958,10 @@ Heterozygosity handling modes:
     print(f"\n[4] Classifying... (Heterozygosity mode: {args.het_mode})")
     results = []
     
-    for i, sample in enumerate(samples):
+    for i, result in enumerate(classifier.classify_samples(samples, sample_geno, args.jobs)):
         if (i + 1) % 50 == 0 or i == len(samples) - 1:
             print(f"    {i + 1}/{len(samples)}", end='\r')
         
-        result = classifier.classify_sample(sample, sample_geno[sample])
         results.append(result)
     
     print("\n    Complete!♡(*´∀｀*)人(*´∀｀*)♡")
@@ -0,0 +1,52 @@
+"""
+Regression test for packed genotype storage (run: python -m unittest discover tests)
+
+data/duplicates.vcf holds five samples over the G and R lineage sites:
+S29_DUP and S02_DUP repeat S29 and S02, and S29_NOCALL is S29 with its
+non-biallelic calls ('1/2', '.|.', ...) written as './.'. All three S29
+columns pack to the same 2-bit codes, but S29 keeps 'mismatch' at the G
+defining site (M201 = '.|.') while S29_NOCALL is 'missing'.
+data/duplicates_result.txt is the output of the script before genotypes
+were packed.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA = os.path.join(ROOT, 'tests', 'data')
+
+
+class DuplicateSamplesTest(unittest.TestCase):
+
+    def classify(self, jobs):
+        """Result file of YHapLZ.py on duplicates.vcf with jobs workers"""
+        with tempfile.TemporaryDirectory() as tmp:
+            # Keep the ISOGG index cache out of the user's cache dir
+            env = dict(os.environ, XDG_CACHE_HOME=tmp)
+            out = os.path.join(tmp, 'out')
+            subprocess.run([sys.executable, os.path.join(ROOT, 'YHapLZ.py'),
+                            '-v', os.path.join(DATA, 'duplicates.vcf'),
+                            '-i', os.path.join(ROOT, 'indexdata.csv'),
+                            '-o', out, '-j', str(jobs)],
+                           env=env, stdout=subprocess.DEVNULL, check=True)
+            result = [name for name in os.listdir(out) if name.startswith('Y_haplogroup_result')]
+            with open(os.path.join(out, result[0])) as f:
+                return f.read()
+
+    def expected(self):
+        with open(os.path.join(DATA, 'duplicates_result.txt')) as f:
+            return f.read()
+
+    def test_single_process(self):
+        self.assertEqual(self.classify(1), self.expected())
+
+    def test_two_workers(self):
+        self.assertEqual(self.classify(2), self.expected())
+
+
+if __name__ == '__main__':
+    unittest.main()